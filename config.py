@@ -18,12 +18,22 @@ CURRENCY = 'CHF'
 # TIMESTAMPED FOLDERS CONFIGURATION
 # =============================================================================
 
-# Generate timestamp for this run (format: YYYYMMDD_HHMMSS)
-RUN_TIMESTAMP = datetime.now().strftime('%Y%m%d_%H%M%S')
-
 # Use timestamped folders to avoid conflicts between runs
 USE_TIMESTAMPED_FOLDERS = True
 
+# Timestamp for this run (format: YYYYMMDD_HHMMSS), computed lazily on
+# first use so importing config has no side effects and the folder layout
+# isn't frozen at import time
+_RUN_TIMESTAMP = None
+
+
+def get_run_timestamp():
+    """Return the timestamp for this run, computed once on first use."""
+    global _RUN_TIMESTAMP
+    if _RUN_TIMESTAMP is None:
+        _RUN_TIMESTAMP = datetime.now().strftime('%Y%m%d_%H%M%S')
+    return _RUN_TIMESTAMP
+
 # =============================================================================
 # PROCESSING CONFIGURATION
 # =============================================================================
@@ -61,10 +71,23 @@ SELECTORS = {
     'pdf_link_pattern': '/fileadmin/pkn/Jahresberichte/{year}/'
 }
 
+# Direct URL template for a specific year's report. When TARGET_YEAR is
+# set, one HEAD request against this URL replaces the whole page-scrape
+# step; the scrape path remains the fallback if the URL does not resolve.
+# Set to None to always scrape.
+REPORT_URL_TEMPLATE = 'https://www.pensionskassen-novartis.ch/fileadmin/pkn/Jahresberichte/{year}/E_Jahresbericht.pdf'
+
 # =============================================================================
 # PDF PARSING CONFIGURATION
 # =============================================================================
 
+# Page windows to scan first, as (start, stop) 0-indexed slices
+# (stop=None means to the end). The reports are short (~6 pages) with
+# both sections on page 4 in every report seen so far, so skipping just
+# the cover pages is enough; a miss falls back to a full-document scan.
+COMPOSITION_PAGE_RANGE = (2, None)
+BALANCE_SHEET_PAGE_RANGE = (2, None)
+
 # Keywords to find "The composition of assets" section
 PDF_CHART_KEYWORDS = [
     "The composition of assets breaks down as follows:",
@@ -92,6 +115,21 @@ PDF_ASSET_NAMES = {
     'TOTAL': ['Total assets']
 }
 
+# Flattened lookups derived from PDF_ASSET_NAMES, built once at import:
+# reverse map (lowercased name -> code) for O(1) lookup per regex hit, and
+# names sorted longest-first so multi-word phrases win over their prefixes
+NAME_TO_CODE = {
+    name.lower(): code
+    for code, names in PDF_ASSET_NAMES.items()
+    for name in names
+}
+
+ALL_ASSET_NAMES_SORTED = sorted(
+    {name for names in PDF_ASSET_NAMES.values() for name in names},
+    key=len,
+    reverse=True
+)
+
 # Percentage chart keywords (pie chart section)
 PERCENTAGE_CHART_KEYWORDS = [
     "Bonds",
@@ -184,6 +222,12 @@ OUTPUT_COLUMNS = [
     }
 ]
 
+# Assets that must carry an allocation percentage, derived once from the
+# column structure above
+REQUIRED_ALLOCATION_ASSETS = tuple(
+    col['asset'] for col in OUTPUT_COLUMNS if col['metric'] == 'ACTUALALLOCATION'
+)
+
 # =============================================================================
 # METADATA STANDARD FIELDS
 # =============================================================================
@@ -251,6 +295,10 @@ PARALLEL_DOWNLOADS = True
 MAX_WORKERS = 3
 DOWNLOAD_DELAY = 1.0  # Seconds between requests
 
+# Files larger than this are fetched in parallel HTTP Range segments
+# (when the server advertises Accept-Ranges: bytes)
+SEGMENTED_DOWNLOAD_THRESHOLD = 4 * 1024 * 1024  # 4 MB
+
 # =============================================================================
 # OUTPUT CONFIGURATION
 # =============================================================================
@@ -260,19 +308,43 @@ BASE_DOWNLOAD_DIR = './downloads'
 BASE_OUTPUT_DIR = './output'
 BASE_LOG_DIR = './logs'
 
-# Apply timestamping if enabled
-if USE_TIMESTAMPED_FOLDERS:
-    DOWNLOAD_DIR = os.path.join(BASE_DOWNLOAD_DIR, RUN_TIMESTAMP)
-    OUTPUT_DIR = os.path.join(BASE_OUTPUT_DIR, RUN_TIMESTAMP)
-    LOG_DIR = os.path.join(BASE_LOG_DIR, RUN_TIMESTAMP)
-else:
-    DOWNLOAD_DIR = BASE_DOWNLOAD_DIR
-    OUTPUT_DIR = BASE_OUTPUT_DIR
-    LOG_DIR = BASE_LOG_DIR
+# Persistent ETag/Last-Modified store for conditional downloads.
+# Lives under the base download dir so it survives timestamped runs.
+ETAG_CACHE_FILE = os.path.join(BASE_DOWNLOAD_DIR, '_etag_cache.json')
+
+# Run directories: timestamped subfolders when enabled, resolved lazily
+# alongside the run timestamp
+
+
+def get_download_dir():
+    """Return the download directory for this run."""
+    if USE_TIMESTAMPED_FOLDERS:
+        return os.path.join(BASE_DOWNLOAD_DIR, get_run_timestamp())
+    return BASE_DOWNLOAD_DIR
+
+
+def get_output_dir():
+    """Return the output directory for this run."""
+    if USE_TIMESTAMPED_FOLDERS:
+        return os.path.join(BASE_OUTPUT_DIR, get_run_timestamp())
+    return BASE_OUTPUT_DIR
+
+
+def get_log_dir():
+    """Return the log directory for this run."""
+    if USE_TIMESTAMPED_FOLDERS:
+        return os.path.join(BASE_LOG_DIR, get_run_timestamp())
+    return BASE_LOG_DIR
 
 # Latest folder (always contains most recent extraction)
 LATEST_OUTPUT_DIR = os.path.join(BASE_OUTPUT_DIR, 'latest')
 
+# Persistent parse-result cache (keyed by PDF path/mtime/size).
+# Lives under the base output dir so it survives timestamped runs.
+# Disable with --no-cache on the command line.
+USE_PARSE_CACHE = True
+PARSE_CACHE_FILE = os.path.join(BASE_OUTPUT_DIR, '.parse_cache.pkl')
+
 # File naming patterns
 DATA_FILE_PATTERN = 'CHEF_NOVARTIS_DATA_{timestamp}.xls'
 META_FILE_PATTERN = 'CHEF_NOVARTIS_META_{timestamp}.xls'
@@ -304,6 +376,12 @@ LOG_TO_FILE = True
 USE_PDFPLUMBER = True  # For text and keyword search
 USE_CAMELOT = True     # For table extraction
 
+# pdfplumber laparams passed to pdfplumber.open(). None (the default)
+# skips pdfminer's per-page layout analysis entirely, which is the fastest
+# setting for the text searches; supply a dict (e.g. {'detect_vertical_text':
+# False}) only if a report needs layout-aware extraction.
+PDFPLUMBER_LAPARAMS = None
+
 # Camelot settings
 CAMELOT_FLAVOR = 'lattice'  # 'lattice' for tables with lines, 'stream' for tables without lines
 CAMELOT_TABLE_AREAS = None  # Auto-detect table areas
@@ -189,7 +189,7 @@ class NovartisFileGenerator:
         os.makedirs(output_dir, exist_ok=True)
 
         # Generate filenames with timestamp
-        timestamp = config.RUN_TIMESTAMP
+        timestamp = config.get_run_timestamp()
         data_filename = config.DATA_FILE_PATTERN.format(timestamp=timestamp)
         meta_filename = config.META_FILE_PATTERN.format(timestamp=timestamp)
         zip_filename = config.ZIP_FILE_PATTERN.format(timestamp=timestamp)
@@ -265,7 +265,7 @@ def main():
     ]
 
     generator = NovartisFileGenerator()
-    result = generator.generate_files(sample_data, config.OUTPUT_DIR)
+    result = generator.generate_files(sample_data, config.get_output_dir())
 
     print("\nGenerated files:")
     for key, path in result.items():
@@ -14,11 +14,11 @@ def setup_logging():
     """
 
     # Create log directory
-    os.makedirs(config.LOG_DIR, exist_ok=True)
+    os.makedirs(config.get_log_dir(), exist_ok=True)
 
     # Generate log filename
-    log_filename = config.LOG_FILE_PATTERN.format(timestamp=config.RUN_TIMESTAMP)
-    log_file_path = os.path.join(config.LOG_DIR, log_filename)
+    log_filename = config.LOG_FILE_PATTERN.format(timestamp=config.get_run_timestamp())
+    log_file_path = os.path.join(config.get_log_dir(), log_filename)
 
     # Create logger
     logger = logging.getLogger()
@@ -63,7 +63,7 @@ def setup_logging():
     logger.info("Logging initialized")
     logger.info(f"Log file: {log_file_path}")
     logger.info(f"Log level: {config.LOG_LEVEL}")
-    logger.info(f"Run timestamp: {config.RUN_TIMESTAMP}")
+    logger.info(f"Run timestamp: {config.get_run_timestamp()}")
     logger.info("="*60)
 
     return logger
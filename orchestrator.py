@@ -37,9 +37,9 @@ def print_configuration():
 
     print(f"  Mode: {mode}")
     print(f"  Source: {config.BASE_URL}")
-    print(f"  Output: {config.OUTPUT_DIR}")
-    print(f"  Downloads: {config.DOWNLOAD_DIR}")
-    print(f"  Timestamp: {config.RUN_TIMESTAMP}")
+    print(f"  Output: {config.get_output_dir()}")
+    print(f"  Downloads: {config.get_download_dir()}")
+    print(f"  Timestamp: {config.get_run_timestamp()}")
     print("-" * 70 + "\n")
 
 
@@ -47,6 +47,10 @@ def main():
     """Main execution flow"""
 
     try:
+        # Command line flags
+        if '--no-cache' in sys.argv:
+            config.USE_PARSE_CACHE = False
+
         # Setup logging
         setup_logging()
 
@@ -75,15 +79,17 @@ def main():
         parser = NovartisPDFParser()
         parsed_data = []
 
-        for i, file_info in enumerate(downloaded_files, 1):
+        # Parse all files in one call so multi-year runs fan out across
+        # the process pool; a single file stays in-process
+        pdf_paths = [file_info['file_path'] for file_info in downloaded_files]
+        results = parser.parse_pdfs(pdf_paths)
+
+        for i, (file_info, result) in enumerate(zip(downloaded_files, results), 1):
             pdf_path = file_info['file_path']
             year = file_info['year']
 
-            print(f"[{i}/{len(downloaded_files)}] Parsing {year} report...")
-            logger.info(f"Parsing report for year {year}: {pdf_path}")
-
-            # Parse the PDF
-            result = parser.parse_pdf(pdf_path)
+            print(f"[{i}/{len(downloaded_files)}] Parsed {year} report")
+            logger.info(f"Parsed report for year {year}: {pdf_path}")
 
             if result:
                 parsed_data.append(result)
@@ -117,7 +123,7 @@ def main():
         print("="*70 + "\n")
 
         generator = NovartisFileGenerator()
-        output_files = generator.generate_files(parsed_data, config.OUTPUT_DIR)
+        output_files = generator.generate_files(parsed_data, config.get_output_dir())
 
         # Step 4: Summary
         print("\n" + "="*70)
@@ -1,15 +1,88 @@
 # parser.py
 # Parse "The composition of assets" from Novartis Annual Report PDFs
 
+# Note: camelot (table extraction) is imported lazily where needed; its
+# import pulls in pandas/cv2/ghostscript and dominates startup time
 import pdfplumber
-import camelot
+import os
+import pickle
 import re
 import logging
+import concurrent.futures
 from datetime import datetime
 import config
 
+# Optional fast text-extraction backend. PDFium extracts page text several
+# times faster than pdfplumber's layout analysis, which is all the keyword
+# searches need; pdfplumber remains the fallback when it is not installed.
+try:
+    import pypdfium2
+except ImportError:
+    pypdfium2 = None
+
 logger = logging.getLogger(__name__)
 
+# Precompiled regex patterns (compiled once at import, reused on every parse)
+_YEAR_RE = re.compile(r'(\d{4})')
+_ANNUAL_REPORT_RE = re.compile(r'Annual Report\s+(\d{4})')
+_DIGITS_RE = re.compile(r'\d+')
+_FIVE_DIGIT_RE = re.compile(r'\b1[34]\d{3}\b')
+
+# Balance-sheet line "Total assets 13 432 13 083": the proven 6-part
+# pattern, anchored per line. Groups 1+2 concatenate to the current-year
+# value; the line anchor also rules out "Total liabilities"
+_TOTAL_ASSETS_RE = re.compile(
+    r'^\s*Total assets\s+(\d{1,3})\s+(\d{3})\s+\d{1,3}\s+\d{3}\s*$',
+    re.MULTILINE | re.IGNORECASE
+)
+
+# Strips grouping characters (spaces, NBSP, commas, tabs) in one C-level pass
+_NUM_TRANS = str.maketrans('', '', ' \xa0,\t')
+
+# Lowercased once at import so page scans don't re-lower every keyword
+_CHART_KEYWORDS_LC = tuple(keyword.lower() for keyword in config.PDF_CHART_KEYWORDS)
+
+# Reverse lookup: lowercased asset name -> output asset code (flattened
+# once at config import)
+_NAME_TO_CODE = config.NAME_TO_CODE
+
+# Single alternation pattern matching any asset name followed by a percentage,
+# e.g. "Bonds 27%". Names come pre-sorted longest-first so longer phrases
+# ("Infrastructure investments") win over their prefixes ("Infrastructure").
+# One finditer pass over the page replaces one re.search per asset synonym.
+_ALL_ASSETS_RE = re.compile(
+    '(' + '|'.join(re.escape(name) for name in config.ALL_ASSET_NAMES_SORTED) + r')\s+(\d+)%',
+    re.IGNORECASE
+)
+
+# Assets whose percentages the output requires; once all of them have been
+# found the scan over the rest of the page can stop
+_REQUIRED_ASSETS = frozenset(config.REQUIRED_ALLOCATION_ASSETS)
+
+# Assets whose percentages must be known before Cash can be inferred as
+# the remainder to 100%
+_KNOWN_ASSETS = ('INFRASTRUCTURE', 'BONDS', 'EQUITIES', 'REALESTATE', 'HEDGEFUNDS/PRIVATEEQUITY')
+
+
+def _fast_page_texts(pdf_path):
+    """
+    Extract all page texts via pypdfium2 (PDFium C++ bindings).
+    Returns a list of page texts, or None if the backend is unavailable.
+    """
+
+    if pypdfium2 is None:
+        return None
+
+    try:
+        doc = pypdfium2.PdfDocument(pdf_path)
+        try:
+            return [page.get_textpage().get_text_range() or '' for page in doc]
+        finally:
+            doc.close()
+    except Exception as e:
+        logger.warning("pypdfium2 text extraction failed, using pdfplumber: %s", e)
+        return None
+
 
 class NovartisPDFParser:
     """Extracts asset composition data from Novartis Annual Report PDFs"""
@@ -17,42 +90,107 @@ class NovartisPDFParser:
     def __init__(self):
         self.debug = config.DEBUG_MODE
         self.logger = logger
+        self._cache = None  # Parse-result cache, loaded lazily from disk
+
+    def _load_cache(self):
+        """Load the persistent parse-result cache on first use."""
+
+        if self._cache is None:
+            self._cache = {}
+            try:
+                with open(config.PARSE_CACHE_FILE, 'rb') as f:
+                    self._cache = pickle.load(f)
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                self.logger.warning("Could not load parse cache: %s", e)
+        return self._cache
 
-    def extract_year_from_pdf(self, pdf_path):
+    def _save_cache(self):
+        """Persist the parse-result cache atomically (write tmp, rename)."""
+
+        try:
+            os.makedirs(os.path.dirname(config.PARSE_CACHE_FILE), exist_ok=True)
+            tmp_path = config.PARSE_CACHE_FILE + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(self._cache, f)
+            os.replace(tmp_path, config.PARSE_CACHE_FILE)
+        except Exception as e:
+            self.logger.warning("Could not save parse cache: %s", e)
+
+    def _page_text(self, pdf, page_texts, page_num):
+        """
+        Extract text for a page exactly once, memoized in page_texts.
+        extract_text() is the dominant cost in pdfplumber, so pages that are
+        never consulted are never extracted.
+        """
+
+        text = page_texts[page_num]
+        if text is None:
+            text = pdf.pages[page_num].extract_text() or ''
+            page_texts[page_num] = text
+        return text
+
+    def extract_year_from_pdf(self, pdf_path, pdf=None, page_texts=None):
         """
         Extract the report year from PDF filename or content.
         Priority: filename -> PDF content
         """
 
         # Try filename first
-        import os
         filename = os.path.basename(pdf_path)
-        year_match = re.search(r'(\d{4})', filename)
+        year_match = _YEAR_RE.search(filename)
         if year_match:
             year = year_match.group(1)
-            self.logger.info(f"Extracted year from filename: {year}")
+            self.logger.info("Extracted year from filename: %s", year)
             return year
 
         # Try PDF content
         try:
-            with pdfplumber.open(pdf_path) as pdf:
-                # Check first 3 pages
-                for page in pdf.pages[:3]:
-                    text = page.extract_text()
-
-                    # Look for "Annual Report YYYY"
-                    match = re.search(r'Annual Report\s+(\d{4})', text)
-                    if match:
-                        year = match.group(1)
-                        self.logger.info(f"Extracted year from PDF content: {year}")
-                        return year
+            if pdf is not None and page_texts is not None:
+                texts = [self._page_text(pdf, page_texts, i)
+                         for i in range(min(3, len(page_texts)))]
+            else:
+                with pdfplumber.open(pdf_path, laparams=config.PDFPLUMBER_LAPARAMS) as standalone_pdf:
+                    texts = [page.extract_text() or '' for page in standalone_pdf.pages[:3]]
+
+            # Check first 3 pages
+            for text in texts:
+                # Look for "Annual Report YYYY"
+                match = _ANNUAL_REPORT_RE.search(text)
+                if match:
+                    year = match.group(1)
+                    self.logger.info("Extracted year from PDF content: %s", year)
+                    return year
 
         except Exception as e:
-            self.logger.error(f"Error extracting year: {e}")
+            self.logger.error("Error extracting year: %s", e)
 
         return None
 
-    def find_composition_section(self, pdf_path):
+    def _clamp_page_range(self, page_range, num_pages):
+        """Clamp a configured (start, stop) page window to the document size."""
+
+        start, stop = page_range
+        stop = num_pages if stop is None else min(stop, num_pages)
+        return min(start, num_pages), stop
+
+    def _scan_for_composition(self, pdf, page_texts, page_nums):
+        """Scan the given pages for the composition keywords."""
+
+        for page_num in page_nums:
+            text = self._page_text(pdf, page_texts, page_num)
+
+            # Lowercase the page once, not once per keyword
+            text_lc = text.lower()
+
+            # Check if this page contains the composition section
+            if any(keyword in text_lc for keyword in _CHART_KEYWORDS_LC):
+                return page_num, text
+
+        return None
+
+    def find_composition_section(self, pdf, page_texts):
         """
         Find the page containing "The composition of assets" section.
         Returns (page_number, page_text).
@@ -60,19 +198,19 @@ class NovartisPDFParser:
 
         self.logger.info("Searching for composition of assets section...")
 
-        try:
-            with pdfplumber.open(pdf_path) as pdf:
-                for page_num, page in enumerate(pdf.pages):
-                    text = page.extract_text()
+        start, stop = self._clamp_page_range(config.COMPOSITION_PAGE_RANGE, len(page_texts))
 
-                    # Check if this page contains the composition section
-                    for keyword in config.PDF_CHART_KEYWORDS:
-                        if keyword.lower() in text.lower():
-                            self.logger.info(f"Found composition section on page {page_num + 1}")
-                            return page_num, text
+        # Scan the configured window first; fall back to the full document
+        hit = self._scan_for_composition(pdf, page_texts, range(start, stop))
 
-        except Exception as e:
-            self.logger.error(f"Error finding composition section: {e}")
+        if hit is None and (start, stop) != (0, len(page_texts)):
+            self.logger.info("Composition section not in configured page range, scanning full document")
+            hit = self._scan_for_composition(pdf, page_texts, range(len(page_texts)))
+
+        if hit is not None:
+            page_num, text = hit
+            self.logger.info("Found composition section on page %d", page_num + 1)
+            return page_num, text
 
         return None, None
 
@@ -84,24 +222,28 @@ class NovartisPDFParser:
 
         percentages = {}
 
+        if not text:
+            return percentages
+
         self.logger.info("Extracting percentages from text...")
 
-        # For each asset class, look for percentage
-        for asset_code, asset_names in config.PDF_ASSET_NAMES.items():
-            for asset_name in asset_names:
-                # Pattern: "Asset Name XX%" (flexible spacing)
-                pattern = rf'{re.escape(asset_name)}\s+(\d+)%'
-                match = re.search(pattern, text, re.IGNORECASE)
+        # Single pass: match any asset name + percentage, map name back to code.
+        # setdefault keeps the first match per asset (same as the old per-asset break).
+        for match in _ALL_ASSETS_RE.finditer(text):
+            asset_code = _NAME_TO_CODE[match.group(1).lower()]
 
-                if match:
-                    percentage = float(match.group(1))
-                    percentages[asset_code] = percentage
-                    self.logger.debug(f"Found {asset_code}: {percentage}%")
-                    break  # Found match for this asset, move to next
+            if asset_code not in percentages:
+                percentage = float(match.group(2))
+                percentages[asset_code] = percentage
+                self.logger.debug("Found %s: %s%%", asset_code, percentage)
+
+                # All required assets found - skip the rest of the page
+                if _REQUIRED_ASSETS <= percentages.keys():
+                    break
 
         return percentages
 
-    def find_balance_sheet_page(self, pdf_path):
+    def find_balance_sheet_page(self, pdf, page_texts):
         """
         Find the page containing "Balance sheet" section.
         Returns page number (0-indexed) or None if not found.
@@ -109,19 +251,29 @@ class NovartisPDFParser:
 
         self.logger.info("Searching for Balance sheet page...")
 
-        try:
-            with pdfplumber.open(pdf_path) as pdf:
-                for page_num, page in enumerate(pdf.pages):
-                    text = page.extract_text()
-                    if text and 'balance sheet' in text.lower():
-                        self.logger.info(f"Found Balance sheet on page {page_num + 1}")
-                        return page_num
-        except Exception as e:
-            self.logger.error(f"Error searching for Balance sheet: {e}")
+        start, stop = self._clamp_page_range(config.BALANCE_SHEET_PAGE_RANGE, len(page_texts))
+
+        # The balance sheet sits in the back of an annual report, so search
+        # the configured window from the last page backwards - most pages
+        # are never extracted
+        for page_num in reversed(range(start, stop)):
+            text = self._page_text(pdf, page_texts, page_num)
+            if text and 'balance sheet' in text.lower():
+                self.logger.info("Found Balance sheet on page %d", page_num + 1)
+                return page_num
+
+        # Fall back to the full document
+        if (start, stop) != (0, len(page_texts)):
+            self.logger.info("Balance sheet not in configured page range, scanning full document")
+            for page_num in reversed(range(len(page_texts))):
+                text = self._page_text(pdf, page_texts, page_num)
+                if text and 'balance sheet' in text.lower():
+                    self.logger.info("Found Balance sheet on page %d", page_num + 1)
+                    return page_num
 
         return None
 
-    def extract_total_assets_from_table(self, pdf_path, page_num=None):
+    def extract_total_assets_from_table(self, pdf, page_texts, page_num=None, fast_text=False):
         """
         Extract "Total assets" value from the balance sheet table.
         Uses proven 6-part pattern validated across 2020-2024 reports.
@@ -133,68 +285,58 @@ class NovartisPDFParser:
 
         # If page_num not provided, search for Balance sheet page dynamically
         if page_num is None:
-            page_num = self.find_balance_sheet_page(pdf_path)
+            page_num = self.find_balance_sheet_page(pdf, page_texts)
             if page_num is None:
                 self.logger.error("Balance sheet page not found")
                 return None
 
-        self.logger.info(f"Extracting total assets from page {page_num + 1}...")
+        self.logger.info("Extracting total assets from page %d...", page_num + 1)
 
-        try:
-            with pdfplumber.open(pdf_path) as pdf:
-                page = pdf.pages[page_num]
-                text = page.extract_text()
+        if fast_text:
+            # Cached text came from the fast PDFium backend; re-extract this
+            # one page with pdfplumber, whose line layout the 6-part pattern
+            # was validated against
+            text = pdf.pages[page_num].extract_text() or ''
+        else:
+            text = self._page_text(pdf, page_texts, page_num)
 
-                if not text:
-                    self.logger.error("No text extracted from page")
-                    return None
-
-                lines = text.split('\n')
-
-                # Find "Total assets" line (exclude "Total liabilities")
-                for line in lines:
-                    if 'total assets' in line.lower() and 'total liabilities' not in line.lower():
-                        self.logger.debug(f"Found Total assets line: [{line}]")
-
-                        # Split by spaces
-                        parts = line.split()
-                        self.logger.debug(f"Split into {len(parts)} parts: {parts}")
-
-                        # Validate expected pattern: ['Total', 'assets', d1, d2, d3, d4]
-                        if len(parts) != 6:
-                            self.logger.warning(f"Unexpected pattern: expected 6 parts, got {len(parts)}")
-                            # Try fallback method
-                            return self.extract_total_assets_fallback(line, parts)
-
-                        if parts[0].lower() != 'total' or parts[1].lower() != 'assets':
-                            self.logger.warning(f"Pattern validation failed: parts[0]={parts[0]}, parts[1]={parts[1]}")
-                            return None
+        if not text:
+            self.logger.error("No text extracted from page")
+            return None
 
-                        # Reconstruct current year value from parts[2] + parts[3]
-                        # Example: ['Total', 'assets', '13', '432', '13', '083'] -> "13432"
-                        current_year_str = parts[2] + parts[3]
-                        self.logger.debug(f"Reconstructed current year value: {current_year_str}")
+        # Fast path: one anchored scan instead of a Python-level line loop
+        match = _TOTAL_ASSETS_RE.search(text)
+        if match:
+            # Reconstruct current year value from the two leading groups
+            # Example: "Total assets 13 432 13 083" -> "13" + "432" = "13432"
+            current_year_str = match.group(1) + match.group(2)
+            self.logger.debug("Reconstructed current year value: %s", current_year_str)
 
-                        # Clean and convert
-                        total_assets = self.clean_number(current_year_str)
+            # Clean and convert
+            total_assets = self.clean_number(current_year_str)
 
-                        if total_assets is None:
-                            self.logger.error(f"Failed to convert '{current_year_str}' to number")
-                            return None
+            if total_assets is None:
+                self.logger.error("Failed to convert '%s' to number", current_year_str)
+                return None
 
-                        # Validation: Total assets should be > 10000 CHF millions
-                        if total_assets < 10000:
-                            self.logger.warning(f"Total assets value {total_assets} seems too low (expected > 10000)")
+            # Validation: Total assets should be > 10000 CHF millions
+            if total_assets < 10000:
+                self.logger.warning("Total assets value %s seems too low (expected > 10000)", total_assets)
 
-                        self.logger.info(f"Extracted Total assets: {total_assets} CHF millions")
-                        return total_assets
+            self.logger.info("Extracted Total assets: %s CHF millions", total_assets)
+            return total_assets
 
-                self.logger.error("'Total assets' line not found in page text")
-                return None
+        # Anchored pattern missed: locate the "Total assets" heading line and
+        # try the fallback method. Only a short prefix is lowercased - the
+        # heading starts the line, so lowercasing the full line (and "Total
+        # liabilities" lines with it) is wasted work
+        for line in text.split('\n'):
+            if line[:24].lstrip().lower().startswith('total assets'):
+                self.logger.warning("Unexpected pattern on Total assets line, trying fallback")
+                return self.extract_total_assets_fallback(line, line.split())
 
-        except Exception as e:
-            self.logger.error(f"Error extracting total assets: {e}")
-            return None
+        self.logger.error("'Total assets' line not found in page text")
+        return None
 
     def extract_total_assets_fallback(self, line, parts):
         """
@@ -206,9 +348,9 @@ class NovartisPDFParser:
 
         # If we have fewer parts, maybe numbers aren't space-separated
         # Try to find all digit sequences
-        digit_sequences = re.findall(r'\d+', line)
+        digit_sequences = _DIGITS_RE.findall(line)
 
-        self.logger.debug(f"Found digit sequences: {digit_sequences}")
+        self.logger.debug("Found digit sequences: %s", digit_sequences)
 
         if len(digit_sequences) >= 2:
             # Try to reconstruct from digit sequences
@@ -219,15 +361,15 @@ class NovartisPDFParser:
                 val = self.clean_number(combined)
 
                 if val and 10000 <= val <= 50000:
-                    self.logger.info(f"Fallback succeeded: {val} CHF millions")
+                    self.logger.info("Fallback succeeded: %s CHF millions", val)
                     return val
 
         # Last resort: try to extract any 5-digit number
-        five_digit_match = re.search(r'\b1[34]\d{3}\b', line)
+        five_digit_match = _FIVE_DIGIT_RE.search(line)
         if five_digit_match:
             val = self.clean_number(five_digit_match.group())
             if val:
-                self.logger.warning(f"Using last resort extraction: {val} CHF millions")
+                self.logger.warning("Using last resort extraction: %s CHF millions", val)
                 return val
 
         self.logger.error("Fallback extraction failed")
@@ -239,8 +381,8 @@ class NovartisPDFParser:
         if value_str is None or value_str == '' or value_str == 'nan':
             return None
 
-        # Remove spaces, commas, and other non-numeric characters except decimal point
-        cleaned = str(value_str).replace(' ', '').replace(',', '').replace('\xa0', '').strip()
+        # Remove spaces, commas, and other grouping characters in a single pass
+        cleaned = str(value_str).translate(_NUM_TRANS)
 
         # Try to convert to float
         try:
@@ -254,17 +396,21 @@ class NovartisPDFParser:
         Cash = Liquidity + Receivables, or inferred from other percentages.
         """
 
-        # Check if we have Infrastructure, Bonds, Shares, Real Estate, Hedge Funds
-        known_assets = ['INFRASTRUCTURE', 'BONDS', 'EQUITIES', 'REALESTATE', 'HEDGEFUNDS/PRIVATEEQUITY']
+        # Accumulate the known assets in a single pass, bailing out as soon
+        # as one is missing
+        total_known = 0.0
+        for asset in _KNOWN_ASSETS:
+            value = percentages.get(asset)
+            if value is None:
+                return None
+            total_known += value
 
-        if all(asset in percentages for asset in known_assets):
-            # Calculate remaining percentage for Cash
-            total_known = sum(percentages[asset] for asset in known_assets)
-            cash_percentage = 100.0 - total_known
+        # Calculate remaining percentage for Cash
+        cash_percentage = 100.0 - total_known
 
-            if 0 <= cash_percentage <= 100:
-                self.logger.info(f"Calculated CASH percentage: {cash_percentage}%")
-                return cash_percentage
+        if 0 <= cash_percentage <= 100:
+            self.logger.info("Calculated CASH percentage: %s%%", cash_percentage)
+            return cash_percentage
 
         return None
 
@@ -274,42 +420,70 @@ class NovartisPDFParser:
         Returns dict with year and all asset class data.
         """
 
-        self.logger.info(f"\nParsing PDF: {pdf_path}")
+        self.logger.info("\nParsing PDF: %s", pdf_path)
 
-        # Extract year
-        year = self.extract_year_from_pdf(pdf_path)
+        # Skip the parse entirely if this exact file was parsed before
+        cache_key = None
+        if config.USE_PARSE_CACHE:
+            try:
+                stat = os.stat(pdf_path)
+                cache_key = (os.path.abspath(pdf_path), stat.st_mtime, stat.st_size)
+            except OSError:
+                pass
 
-        if not year:
-            self.logger.error("Could not extract year from PDF")
-            return None
+            if cache_key is not None and cache_key in self._load_cache():
+                self.logger.info("Using cached parse result for %s", pdf_path)
+                return self._cache[cache_key]
 
-        # Find composition section
-        page_num, page_text = self.find_composition_section(pdf_path)
+        # Prefill page texts through the fast PDFium backend when available;
+        # the keyword searches don't need pdfplumber's layout analysis
+        fast_texts = _fast_page_texts(pdf_path)
 
-        if page_num is None:
-            self.logger.error("Could not find composition of assets section")
-            return None
+        # Open the PDF once; without the fast backend, page texts are
+        # extracted lazily and memoized, so pages that no search touches
+        # are never extracted
+        try:
+            with pdfplumber.open(pdf_path, laparams=config.PDFPLUMBER_LAPARAMS) as pdf:
+                page_texts = fast_texts if fast_texts is not None else [None] * len(pdf.pages)
 
-        # Extract percentages from text
-        percentages = self.extract_percentages_from_text(page_text)
+                # Extract year
+                year = self.extract_year_from_pdf(pdf_path, pdf, page_texts)
 
-        if not percentages:
-            self.logger.error("Could not extract asset percentages")
-            return None
+                if not year:
+                    self.logger.error("Could not extract year from PDF")
+                    return None
 
-        self.logger.info(f"Extracted {len(percentages)} asset percentages")
+                # Find composition section
+                page_num, page_text = self.find_composition_section(pdf, page_texts)
 
-        # Calculate Cash if not found
-        if 'CASH' not in percentages:
-            cash_pct = self.calculate_cash_percentage(percentages)
-            if cash_pct is not None:
-                percentages['CASH'] = cash_pct
+                if page_num is None:
+                    self.logger.error("Could not find composition of assets section")
+                    return None
+
+                # Extract percentages from text
+                percentages = self.extract_percentages_from_text(page_text)
+
+                if not percentages:
+                    self.logger.error("Could not extract asset percentages")
+                    return None
+
+                self.logger.info("Extracted %d asset percentages", len(percentages))
 
-        # Extract Total assets from Balance sheet (searches dynamically, doesn't use page_num from composition section)
-        total_assets = self.extract_total_assets_from_table(pdf_path)
+                # Calculate Cash if not found
+                if 'CASH' not in percentages:
+                    cash_pct = self.calculate_cash_percentage(percentages)
+                    if cash_pct is not None:
+                        percentages['CASH'] = cash_pct
 
-        if total_assets is None:
-            self.logger.warning("Could not extract total assets value")
+                # Extract Total assets from Balance sheet (searches dynamically, doesn't use page_num from composition section)
+                total_assets = self.extract_total_assets_from_table(
+                    pdf, page_texts, fast_text=fast_texts is not None)
+
+                if total_assets is None:
+                    self.logger.warning("Could not extract total assets value")
+        except Exception as e:
+            self.logger.error("Error parsing PDF: %s", e)
+            return None
 
         # Build result dictionary
         result = {
@@ -324,29 +498,58 @@ class NovartisPDFParser:
             deviation = abs(total_pct - 100.0)
 
             if deviation > config.PERCENTAGE_TOLERANCE:
-                self.logger.warning(f"Percentage total: {total_pct}% (deviation: {deviation}%)")
+                self.logger.warning("Percentage total: %s%% (deviation: %s%%)", total_pct, deviation)
             else:
-                self.logger.info(f"Percentage validation passed: {total_pct}%")
+                self.logger.info("Percentage validation passed: %s%%", total_pct)
 
         # Check if all required assets are present
         if config.REQUIRE_ALL_ASSETS:
-            required_assets = [col['asset'] for col in config.OUTPUT_COLUMNS if col['metric'] == 'ACTUALALLOCATION']
-            missing_assets = [asset for asset in required_assets if asset not in percentages]
+            missing_assets = [asset for asset in config.REQUIRED_ALLOCATION_ASSETS
+                              if asset not in percentages]
 
             if missing_assets:
-                self.logger.warning(f"Missing assets: {', '.join(missing_assets)}")
+                self.logger.warning("Missing assets: %s", ', '.join(missing_assets))
+
+        self.logger.info("Successfully parsed %s - Total Assets: %s, Percentages: %d", year, total_assets, len(percentages))
 
-        self.logger.info(f"Successfully parsed {year} - Total Assets: {total_assets}, Percentages: {len(percentages)}")
+        # Remember the result for future runs
+        if cache_key is not None:
+            self._load_cache()[cache_key] = result
+            self._save_cache()
 
         return result
 
+    def parse_pdfs(self, pdf_paths):
+        """
+        Parse multiple PDF reports in parallel using a process pool.
+        Parsing is CPU-bound, so worker processes scale across cores.
+        Returns results in the same order as pdf_paths.
+        """
+
+        if len(pdf_paths) <= 1:
+            return [self.parse_pdf(pdf_path) for pdf_path in pdf_paths]
+
+        self.logger.info("Parsing %d PDFs with %d workers", len(pdf_paths), config.MAX_WORKERS)
+
+        with concurrent.futures.ProcessPoolExecutor(max_workers=config.MAX_WORKERS) as executor:
+            return list(executor.map(_parse_one, pdf_paths))
+
+
+def _parse_one(pdf_path):
+    """Worker entry point: parse a single PDF in a separate process."""
+    return NovartisPDFParser().parse_pdf(pdf_path)
+
 
 def main():
     """Test the parser with a sample PDF"""
     import sys
 
+    if '--no-cache' in sys.argv:
+        sys.argv.remove('--no-cache')
+        config.USE_PARSE_CACHE = False
+
     if len(sys.argv) < 2:
-        print("Usage: python parser.py <pdf_file>")
+        print("Usage: python parser.py [--no-cache] <pdf_file>")
         sys.exit(1)
 
     pdf_file = sys.argv[1]